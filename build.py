@@ -3,16 +3,169 @@
 Build script for creating cross-platform executables using PyInstaller.
 """
 
+import argparse
+import datetime
+import functools
+import json
+import multiprocessing
 import os
 import sys
 import shutil
 import subprocess
 import platform
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 
 
+# Serialises output from the thread pool in main() so messages from
+# concurrent workers never interleave mid-line
+_print_lock = threading.Lock()
+
+
+# Installer script templates, keyed by platform in create_installer_script()
+_WIN_INSTALLER = '''
+@echo off
+echo Installing Base Converter...
+
+REM Create installation directory
+set INSTALL_DIR=%PROGRAMFILES%\\BaseConverter
+if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
+
+REM Copy application folder (default build) or single executable (BUILD_ONEFILE=1).
+REM The CLI-only build is copied first so the full build wins if both are present.
+for /d %%D in (base-converter-cli-windows-*) do xcopy /e /i /y "%%D" "%INSTALL_DIR%"
+for /d %%D in (base-converter-windows-*) do xcopy /e /i /y "%%D" "%INSTALL_DIR%"
+for %%F in (base-converter-cli-windows-*.exe) do copy /y "%%F" "%INSTALL_DIR%\\base-converter.exe"
+for %%F in (base-converter-windows-*.exe) do copy /y "%%F" "%INSTALL_DIR%\\base-converter.exe"
+
+REM Add to PATH (requires admin privileges)
+setx PATH "%PATH%;%INSTALL_DIR%" /M
+
+echo Base Converter installed successfully!
+echo You can now use 'base-converter' command from any command prompt.
+pause
+'''.strip()
+
+_MAC_INSTALLER = '''#!/bin/bash
+echo "Installing Base Converter..."
+
+# Create installation directories
+INSTALL_DIR="/usr/local/bin"
+LIB_DIR="/usr/local/lib/base-converter"
+sudo mkdir -p "$INSTALL_DIR"
+
+# Prefer the full build; fall back to the CLI-only build
+SOURCE=""
+for candidate in base-converter-darwin-* base-converter-cli-darwin-*; do
+    if [ -e "$candidate" ]; then
+        SOURCE="$candidate"
+        break
+    fi
+done
+
+if [ -z "$SOURCE" ]; then
+    echo "No base-converter build found in $(pwd)"
+    exit 1
+fi
+
+if [ -d "$SOURCE" ]; then
+    # Copy application folder and link the executable into PATH
+    sudo rm -rf "$LIB_DIR"
+    sudo mkdir -p "$(dirname "$LIB_DIR")"
+    sudo cp -R "$SOURCE" "$LIB_DIR"
+    sudo chmod +x "$LIB_DIR/base-converter"
+    sudo ln -sf "$LIB_DIR/base-converter" "$INSTALL_DIR/base-converter"
+else
+    # Copy single-file executable
+    sudo cp "$SOURCE" "$INSTALL_DIR/base-converter"
+    sudo chmod +x "$INSTALL_DIR/base-converter"
+fi
+
+echo "Base Converter installed successfully!"
+echo "You can now use 'base-converter' command from any terminal."
+'''.strip()
+
+_LINUX_INSTALLER = '''#!/bin/bash
+echo "Installing Base Converter..."
+
+# Create installation directories
+INSTALL_DIR="/usr/local/bin"
+LIB_DIR="/usr/local/lib/base-converter"
+sudo mkdir -p "$INSTALL_DIR"
+
+# Prefer the full build; fall back to the CLI-only build
+SOURCE=""
+for candidate in base-converter-linux-* base-converter-cli-linux-*; do
+    if [ -e "$candidate" ]; then
+        SOURCE="$candidate"
+        break
+    fi
+done
+
+if [ -z "$SOURCE" ]; then
+    echo "No base-converter build found in $(pwd)"
+    exit 1
+fi
+
+if [ -d "$SOURCE" ]; then
+    # Copy application folder and link the executable into PATH
+    sudo rm -rf "$LIB_DIR"
+    sudo mkdir -p "$(dirname "$LIB_DIR")"
+    sudo cp -R "$SOURCE" "$LIB_DIR"
+    sudo chmod +x "$LIB_DIR/base-converter"
+    sudo ln -sf "$LIB_DIR/base-converter" "$INSTALL_DIR/base-converter"
+else
+    # Copy single-file executable
+    sudo cp "$SOURCE" "$INSTALL_DIR/base-converter"
+    sudo chmod +x "$INSTALL_DIR/base-converter"
+fi
+
+echo "Base Converter installed successfully!"
+echo "You can now use 'base-converter' command from any terminal."
+
+# Create desktop entry (optional); the CLI-only build has no GUI to launch
+case "$SOURCE" in
+    base-converter-cli-*)
+        ;;
+    *)
+        DESKTOP_FILE="$HOME/.local/share/applications/base-converter.desktop"
+        mkdir -p "$(dirname "$DESKTOP_FILE")"
+        cat > "$DESKTOP_FILE" << EOF
+[Desktop Entry]
+Name=Base Converter
+Comment=A comprehensive base conversion utility
+Exec=base-converter --gui
+Icon=accessories-calculator
+Terminal=false
+Type=Application
+Categories=Utility;Calculator;
+EOF
+        echo "A desktop entry has been created for GUI access."
+        ;;
+esac
+'''.strip()
+
+
+# Runners used by the CI build matrix (see --emit-matrix)
+CI_TARGETS = [
+    {'os': 'ubuntu-latest', 'platform': 'linux', 'arch': 'x64'},
+    {'os': 'windows-latest', 'platform': 'windows', 'arch': 'x64'},
+    {'os': 'macos-latest', 'platform': 'macos', 'arch': 'x64'},
+    {'os': 'macos-latest', 'platform': 'macos', 'arch': 'arm64'},
+]
+
+
+@functools.lru_cache(maxsize=1)
 def get_platform_info():
-    """Get platform-specific information."""
+    """Get platform-specific information.
+
+    The result is cached since the platform cannot change during a build.
+    """
     system = platform.system().lower()
     architecture = platform.machine().lower()
     
@@ -26,18 +179,153 @@ def get_platform_info():
     return system, architecture
 
 
+def remove_tree(dir_name):
+    """Remove a directory tree using the native tool, falling back to shutil.
+
+    PyInstaller work directories hold thousands of small files, which the
+    platform's own rd/rm remove faster than shutil.rmtree. A missing
+    directory is a no-op for rm -rf; on Windows, and whenever the shutil
+    fallback runs, it raises FileNotFoundError instead.
+    """
+    system, _ = get_platform_info()
+    if system == 'windows':
+        cmd = ['cmd', '/c', 'rd', '/s', '/q', dir_name]
+    else:
+        cmd = ['rm', '-rf', dir_name]
+    
+    try:
+        subprocess.check_call(cmd, stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(dir_name)
+
+
+def is_force_clean():
+    """Return True when a from-scratch build was requested via FORCE_CLEAN=1."""
+    return os.environ.get('FORCE_CLEAN') == '1'
+
+
+def is_build_cache_stale():
+    """Check whether any cached PyInstaller analysis is older than the sources."""
+    toc_paths = list(Path('build').glob('cache/*/*/Analysis-00.toc'))
+    if not toc_paths:
+        return False
+    
+    src_mtime = max(os.path.getmtime(path) for path in Path('src').rglob('*.py'))
+    return any(src_mtime > os.path.getmtime(toc_path) for toc_path in toc_paths)
+
+
 def clean_build_dirs():
-    """Clean build and dist directories."""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
+    """Clean build output directories.
+
+    The build/ directory holds PyInstaller's cached analysis and caches. It
+    is only removed when FORCE_CLEAN=1 is set or a source file is newer than
+    a cached analysis. This happens once, before any build starts, rather
+    than through per-build --clean flags while other profiles are building.
+    """
+    dirs_to_clean = ['dist', '__pycache__']
+    if is_force_clean() or is_build_cache_stale():
+        dirs_to_clean.insert(0, 'build')
     for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+        with suppress(FileNotFoundError):
+            remove_tree(dir_name)
             print(f"Cleaned {dir_name} directory")
 
 
-def create_spec_file():
-    """Create PyInstaller spec file with proper configuration."""
-    spec_content = '''
+def locked_print(message):
+    """Print a message without interleaving it with other worker threads."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def write_text_file(path, content, newline='\n'):
+    """Write UTF-8 text with explicit line endings, regardless of host OS.
+
+    Path.write_text only accepts newline= on Python 3.10+, so translate the
+    line endings here and write the encoded bytes directly.
+    """
+    Path(path).write_bytes(content.replace('\n', newline).encode('utf-8'))
+
+
+def is_onefile_build():
+    """Return True when a single-file executable was requested via BUILD_ONEFILE=1."""
+    return os.environ.get('BUILD_ONEFILE') == '1'
+
+
+def format_spec_list(items):
+    """Format a list of strings as an indented list literal for the spec file."""
+    lines = ''.join(f"        {item!r},\n" for item in items)
+    return f"[\n{lines}    ]"
+
+
+def create_spec_file(cli_only=False):
+    """Create PyInstaller spec file with proper configuration.
+
+    The default is a one-folder build (thin EXE plus COLLECT), which avoids
+    extracting the whole archive to a temp directory on every launch. Set
+    BUILD_ONEFILE=1 to produce a single self-extracting executable instead.
+    UPX is disabled: decompressing on every launch costs more than it saves.
+
+    With cli_only=True the Tk runtime is excluded from the bundle entirely;
+    the resulting executable cannot launch the GUI.
+
+    Returns the path of the generated spec file.
+    """
+    hiddenimports = ['argparse']
+    excludes = [
+        'matplotlib',
+        'numpy',
+        'pandas',
+        'scipy',
+        'IPython',
+        'jupyter',
+        'PIL',
+        # Standard library packages the application never imports; excluding
+        # them prunes the import graph PyInstaller has to analyse
+        'unittest',
+        'test',
+        '_pytest',
+        'pydoc',
+        'distutils',
+        'setuptools',
+        'pkg_resources',
+        'lib2to3',
+        'email',
+        'html',
+        'http.server',
+        'xml.dom',
+        'xml.sax',
+        'multiprocessing',
+        'asyncio',
+        # PyInstaller always excludes __main__ and appends it when missing,
+        # which would invalidate the cached Analysis on every rebuild
+        '__main__',
+    ]
+    
+    if cli_only:
+        excludes += ['tkinter', '_tkinter', 'tcl', 'tk']
+    else:
+        hiddenimports = [
+            'tkinter',
+            'tkinter.ttk',
+            'tkinter.messagebox',
+            'tkinter.filedialog',
+            'tkinter.scrolledtext',
+        ] + hiddenimports
+    
+    # One-folder builds keep .pyc files loose on disk instead of packing
+    # them into a zlib-compressed PYZ, so repeat launches read them
+    # straight from the page cache
+    noarchive = not is_onefile_build()
+    
+    # Strip symbol tables from bundled binaries; stripping breaks code
+    # signatures on macOS and is not supported for Windows binaries.
+    # Stripped copies go through PyInstaller's bincache, which is only safe
+    # for parallel profile builds because build_executable gives each
+    # profile its own PYINSTALLER_CONFIG_DIR.
+    system, _ = get_platform_info()
+    strip = system not in ('darwin', 'windows')
+    
+    spec_content = f'''
 # -*- mode: python ; coding: utf-8 -*-
 
 import sys
@@ -57,33 +345,22 @@ a = Analysis(
     datas=[
         ('src/*.py', 'src'),
     ],
-    hiddenimports=[
-        'tkinter',
-        'tkinter.ttk',
-        'tkinter.messagebox', 
-        'tkinter.filedialog',
-        'tkinter.scrolledtext',
-        'argparse',
-    ],
+    hiddenimports={format_spec_list(hiddenimports)},
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[
-        'matplotlib',
-        'numpy',
-        'pandas',
-        'scipy',
-        'IPython',
-        'jupyter',
-    ],
+    excludes={format_spec_list(excludes)},
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
-    noarchive=False,
+    noarchive={noarchive},
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
+'''
+    
+    if is_onefile_build():
+        spec_content += f'''
 exe = EXE(
     pyz,
     a.scripts,
@@ -94,8 +371,8 @@ exe = EXE(
     name=exe_name,
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
+    strip={strip},
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=True,
@@ -106,154 +383,200 @@ exe = EXE(
     entitlements_file=None,
     icon=None,  # Add icon path here if you have one
 )
+'''
+    else:
+        spec_content += f'''
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name=exe_name,
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip={strip},
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=None,  # Add icon path here if you have one
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip={strip},
+    upx=False,
+    upx_exclude=[],
+    name='base-converter',
+)
 '''
     
-    with open('base-converter.spec', 'w') as f:
-        f.write(spec_content.strip())
-    print("Created PyInstaller spec file")
+    spec_path = 'base-converter-cli.spec' if cli_only else 'base-converter.spec'
+    write_text_file(spec_path, spec_content.strip())
+    print(f"Created PyInstaller spec file: {spec_path}")
+    return spec_path
 
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def get_nuitka_command(cli_only, output_dir, exe_name):
+    """Get the Nuitka command that compiles the application to C.
+
+    Nuitka produces a native executable with no bootloader or archive
+    extraction step, at the cost of a C compiler toolchain and a much
+    longer build.
+    """
+    cmd = [
+        sys.executable, '-m', 'nuitka',
+        '--onefile' if is_onefile_build() else '--standalone',
+        '--follow-imports',
+        '--python-flag=no_asserts',
+        '--python-flag=no_docstrings',
+        '--assume-yes-for-downloads',
+        f'--output-dir={output_dir}',
+        f'--output-filename={exe_name}',
+    ]
+    if cli_only:
+        cmd.append('--nofollow-import-to=tkinter,src.gui')
+    else:
+        cmd.append('--enable-plugin=tk-inter')
+    cmd.append('src/main.py')
+    return cmd
+
+
+def build_executable(cli_only=False, backend='pyinstaller'):
+    """Build the executable using PyInstaller or Nuitka.
+
+    Each profile uses its own work and dist directories so that several
+    profiles can be built concurrently without colliding. The PyInstaller
+    work directory persists between runs so its analysis can be reused.
+    """
     system, arch = get_platform_info()
+    profile = 'cli' if cli_only else 'gui'
+    exe_name = 'base-converter'
+    if system == 'windows':
+        exe_name += '.exe'
     
-    print(f"Building for {system}-{arch}...")
+    dist_path = Path('dist')
+    profile_dist_path = dist_path / profile
     
-    # Create spec file
-    create_spec_file()
+    print(f"Building {profile} profile for {system}-{arch} with {backend}...")
     
-    # Build command
-    cmd = [
-        sys.executable, '-m', 'PyInstaller',
-        '--clean',
-        'base-converter.spec'
-    ]
+    if backend == 'nuitka':
+        cmd = get_nuitka_command(cli_only, profile_dist_path, exe_name)
+        env = {**os.environ, 'PYTHONPATH': os.getcwd()}
+        built_dir = profile_dist_path / 'main.dist'
+    else:
+        # Create spec file
+        spec_path = create_spec_file(cli_only)
+        
+        # Build command
+        cmd = [
+            sys.executable, '-m', 'PyInstaller',
+            '--noconfirm',
+            '--log-level', 'WARN',
+            '--workpath', str(Path('build') / 'cache' / profile),
+            '--distpath', str(profile_dist_path),
+            spec_path
+        ]
+        
+        # Store archive entries uncompressed. This makes the bundle larger on
+        # disk, but the bootloader no longer has to inflate it on every launch.
+        # PYTHONOPTIMIZE=2 makes the collected bytecode drop asserts and
+        # docstrings, which shrinks the bundle and speeds up unmarshalling.
+        # Each profile also gets its own PyInstaller config/cache directory:
+        # the default per-user bincache is not safe for concurrent builds.
+        env = {
+            **os.environ,
+            'PYINSTALLER_ZLIB_COMPRESSION_LEVEL': '0',
+            'PYTHONOPTIMIZE': '2',
+            'PYINSTALLER_CONFIG_DIR': str((Path('build') / 'cache' / profile / 'config').resolve()),
+        }
+        built_dir = profile_dist_path / 'base-converter'
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Stream build output as it is produced instead of buffering it
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1, env=env) as proc:
+            for line in proc.stdout:
+                print(f"[{profile}] {line}", end='', flush=True)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
         print("Build successful!")
-        print(result.stdout)
         
-        # Rename output file to include platform info
-        exe_name = 'base-converter'
-        if system == 'windows':
-            exe_name += '.exe'
+        # Move output out of the profile directory and include platform info
+        if is_onefile_build():
+            original_exe = profile_dist_path / exe_name
+            platform_exe = dist_path / f'{get_artifact_name(cli_only)}{".exe" if system == "windows" else ""}'
             
-        dist_path = Path('dist')
-        original_exe = dist_path / exe_name
-        platform_exe = dist_path / f'base-converter-{system}-{arch}{".exe" if system == "windows" else ""}'
-        
-        if original_exe.exists():
-            if platform_exe.exists():
-                platform_exe.unlink()
-            original_exe.rename(platform_exe)
-            print(f"Created: {platform_exe}")
+            if original_exe.exists():
+                if platform_exe.exists():
+                    platform_exe.unlink()
+                original_exe.rename(platform_exe)
+                print(f"Created: {platform_exe}")
+        else:
+            original_dir = built_dir
+            platform_dir = dist_path / get_artifact_name(cli_only)
             
+            if original_dir.is_dir():
+                if platform_dir.exists():
+                    shutil.rmtree(platform_dir)
+                shutil.move(str(original_dir), str(platform_dir))
+                print(f"Created: {platform_dir}")
+        
+        shutil.rmtree(profile_dist_path, ignore_errors=True)
         return True
         
     except subprocess.CalledProcessError as e:
         print(f"Build failed: {e}")
-        print(f"Error output: {e.stderr}")
         return False
 
 
-def create_installer_script():
-    """Create installer script for different platforms."""
-    system, arch = get_platform_info()
-    
-    if system == 'windows':
-        create_windows_installer()
-    elif system == 'darwin':
-        create_macos_installer()
-    else:
-        create_linux_installer()
-
-
-def create_windows_installer():
-    """Create Windows installer script."""
-    installer_content = '''
-@echo off
-echo Installing Base Converter...
-
-REM Create installation directory
-set INSTALL_DIR=%PROGRAMFILES%\\BaseConverter
-if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
-
-REM Copy executable
-copy base-converter-windows-*.exe "%INSTALL_DIR%\\base-converter.exe"
+def get_artifact_prefix(cli_only=False):
+    """Get the platform-independent artifact name prefix for a build profile."""
+    return 'base-converter-cli' if cli_only else 'base-converter'
 
-REM Add to PATH (requires admin privileges)
-setx PATH "%PATH%;%INSTALL_DIR%" /M
-
-echo Base Converter installed successfully!
-echo You can now use 'base-converter' command from any command prompt.
-pause
-'''
-    
-    with open('install-windows.bat', 'w') as f:
-        f.write(installer_content.strip())
-    print("Created Windows installer script")
 
+def get_artifact_name(cli_only=False):
+    """Get the platform-specific artifact name for a build profile."""
+    system, arch = get_platform_info()
+    return f'{get_artifact_prefix(cli_only)}-{system}-{arch}'
 
-def create_macos_installer():
-    """Create macOS installer script."""
-    installer_content = '''#!/bin/bash
-echo "Installing Base Converter..."
-
-# Create installation directory
-INSTALL_DIR="/usr/local/bin"
-sudo mkdir -p "$INSTALL_DIR"
-
-# Copy executable
-sudo cp base-converter-darwin-* "$INSTALL_DIR/base-converter"
-sudo chmod +x "$INSTALL_DIR/base-converter"
 
-echo "Base Converter installed successfully!"
-echo "You can now use 'base-converter' command from any terminal."
-'''
+def get_executable_path(cli_only=False):
+    """Get the path of the built executable for the current platform."""
+    system, arch = get_platform_info()
+    exe_suffix = '.exe' if system == 'windows' else ''
+    artifact_name = get_artifact_name(cli_only)
     
-    with open('install-macos.sh', 'w') as f:
-        f.write(installer_content.strip())
-    os.chmod('install-macos.sh', 0o755)
-    print("Created macOS installer script")
-
-
-def create_linux_installer():
-    """Create Linux installer script."""
-    installer_content = '''#!/bin/bash
-echo "Installing Base Converter..."
+    if is_onefile_build():
+        return Path('dist') / f'{artifact_name}{exe_suffix}'
+    return Path('dist') / artifact_name / f'base-converter{exe_suffix}'
 
-# Create installation directory
-INSTALL_DIR="/usr/local/bin"
-sudo mkdir -p "$INSTALL_DIR"
 
-# Copy executable
-sudo cp base-converter-linux-* "$INSTALL_DIR/base-converter"
-sudo chmod +x "$INSTALL_DIR/base-converter"
+def get_installer_script():
+    """Return the installer script name and template for the current platform."""
+    system, _ = get_platform_info()
+    return {
+        'windows': ('install-windows.bat', _WIN_INSTALLER),
+        'darwin': ('install-macos.sh', _MAC_INSTALLER),
+    }.get(system, ('install-linux.sh', _LINUX_INSTALLER))
 
-# Create desktop entry (optional)
-DESKTOP_FILE="$HOME/.local/share/applications/base-converter.desktop"
-mkdir -p "$(dirname "$DESKTOP_FILE")"
-cat > "$DESKTOP_FILE" << EOF
-[Desktop Entry]
-Name=Base Converter
-Comment=A comprehensive base conversion utility
-Exec=base-converter --gui
-Icon=accessories-calculator
-Terminal=false
-Type=Application
-Categories=Utility;Calculator;
-EOF
 
-echo "Base Converter installed successfully!"
-echo "You can now use 'base-converter' command from any terminal."
-echo "A desktop entry has been created for GUI access."
-'''
+def create_installer_script():
+    """Create installer script for the current platform."""
+    system, arch = get_platform_info()
+    script_name, template = get_installer_script()
     
-    with open('install-linux.sh', 'w') as f:
-        f.write(installer_content.strip())
-    os.chmod('install-linux.sh', 0o755)
-    print("Created Linux installer script")
+    # Batch files keep CRLF line endings; shell scripts must be LF only
+    write_text_file(script_name, template, newline='\r\n' if system == 'windows' else '\n')
+    if script_name.endswith('.sh'):
+        os.chmod(script_name, 0o755)
+    locked_print(f"Created installer script: {script_name}")
 
 
 def create_package_info():
@@ -262,7 +585,7 @@ def create_package_info():
     
     info_content = f'''Base Converter v1.0
 Platform: {system}-{arch}
-Build Date: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Build Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 INSTALLATION:
 Run the appropriate installer script for your platform:
@@ -271,7 +594,8 @@ Run the appropriate installer script for your platform:
 - Linux: ./install-linux.sh
 
 MANUAL INSTALLATION:
-Copy the executable to a directory in your PATH.
+Copy the base-converter folder somewhere permanent and add it to your PATH
+(or copy the single executable, for BUILD_ONEFILE=1 builds).
 
 USAGE:
 base-converter --gui          # Launch graphical interface
@@ -282,81 +606,216 @@ For more information, visit:
 https://github.com/6639835/base-converter
 '''
     
-    with open('PACKAGE_INFO.txt', 'w') as f:
-        f.write(info_content.strip())
-    print("Created package information file")
+    write_text_file('PACKAGE_INFO.txt', info_content.strip())
+    locked_print("Created package information file")
+
+
+def package_release(profiles, out_path):
+    """Archive the built profiles with the installer and package info.
+
+    Members are read straight from where the build left them, so nothing is
+    copied before archiving. Uses a zip archive on Windows and a single
+    ``tar --zstd`` call elsewhere, falling back to a gzip-compressed tarball
+    via the tarfile module when tar or zstd is unavailable. Every path keeps
+    the same layout: each member sits at the archive root under its own name.
+    Returns the path of the created archive.
+    """
+    out_path = Path(out_path)
+    system, _ = get_platform_info()
+    members = [Path('dist') / get_artifact_name(cli_only) for cli_only in profiles]
+    members += [Path(get_installer_script()[0]), Path('PACKAGE_INFO.txt')]
+    
+    if system == 'windows':
+        archive_path = out_path.with_name(f'{out_path.name}.zip')
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for member in members:
+                archive.write(member, member.name)
+                for path in sorted(member.rglob('*')):
+                    archive.write(path, path.relative_to(member.parent))
+        print(f"Created release archive: {archive_path}")
+        return archive_path
+    
+    archive_path = out_path.with_name(f'{out_path.name}.tar.zst')
+    # Relative -C arguments are cumulative in tar, so pass absolute parents
+    cmd = ['tar', '--zstd', '-cf', str(archive_path)]
+    for member in members:
+        cmd += ['-C', str(member.resolve().parent), member.name]
+    try:
+        subprocess.check_call(cmd)
+    except (OSError, subprocess.CalledProcessError):
+        if archive_path.exists():
+            archive_path.unlink()
+        archive_path = out_path.with_name(f'{out_path.name}.tar.gz')
+        with tarfile.open(archive_path, 'w:gz') as tar:
+            for member in members:
+                tar.add(str(member), arcname=member.name)
+    
+    print(f"Created release archive: {archive_path}")
+    return archive_path
 
 
-def test_executable():
+def test_executable(cli_only=False):
     """Test the built executable."""
-    system, arch = get_platform_info()
-    exe_name = f'base-converter-{system}-{arch}'
-    if system == 'windows':
-        exe_name += '.exe'
-        
-    exe_path = Path('dist') / exe_name
+    exe_path = get_executable_path(cli_only)
     
     if not exe_path.exists():
-        print(f"Executable not found: {exe_path}")
+        locked_print(f"Executable not found: {exe_path}")
         return False
         
+    # Warm-up run primes the OS file cache, so the timed run below
+    # measures steady-state startup instead of a cold disk read. Only the
+    # --list-bases run decides whether the test passes.
+    with suppress(subprocess.TimeoutExpired, OSError):
+        subprocess.run([str(exe_path), '--version'], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, timeout=20)
+    
     try:
         # Test basic functionality
+        start = time.perf_counter()
         result = subprocess.run([str(exe_path), '--list-bases'], 
                               capture_output=True, text=True, timeout=10)
+        elapsed = time.perf_counter() - start
         if result.returncode == 0 and 'Binary' in result.stdout:
-            print("Executable test passed!")
+            locked_print(f"Executable test passed! ({get_artifact_name(cli_only)} --list-bases took {elapsed * 1000:.0f} ms)")
             return True
         else:
-            print(f"Executable test failed: {result.stderr}")
+            locked_print(f"Executable test failed: {result.stderr}")
             return False
     except subprocess.TimeoutExpired:
-        print("Executable test timed out")
+        locked_print("Executable test timed out")
         return False
     except Exception as e:
-        print(f"Error testing executable: {e}")
+        locked_print(f"Error testing executable: {e}")
         return False
 
 
+def get_ci_matrix():
+    """Get the GitHub Actions build matrix with one job per target and profile."""
+    include = []
+    for target in CI_TARGETS:
+        for profile in ('gui', 'cli'):
+            prefix = get_artifact_prefix(profile == 'cli')
+            include.append({
+                **target,
+                'profile': profile,
+                'artifact': f"{prefix}-{target['platform']}-{target['arch']}",
+            })
+    return {'include': include}
+
+
+def parse_args(args=None):
+    """Parse build script arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build Base Converter executables with PyInstaller",
+    )
+    parser.add_argument(
+        "--gui",
+        action="store_true",
+        help="Build the full profile with the graphical interface (default)",
+    )
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Build the command-line-only profile without the Tk runtime",
+    )
+    parser.add_argument(
+        "--emit-matrix",
+        action="store_true",
+        help="Print the CI build matrix as JSON and exit",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["pyinstaller", "nuitka"],
+        default="pyinstaller",
+        help="Build frontend: PyInstaller (default) or Nuitka for native release builds",
+    )
+    
+    parsed = parser.parse_args(args)
+    if not parsed.gui and not parsed.cli:
+        parsed.gui = True
+    return parsed
+
+
 def main():
     """Main build function."""
+    args = parse_args()
+    
+    if args.emit_matrix:
+        print(json.dumps(get_ci_matrix()))
+        return
+    
     print("Base Converter Build Script")
     print("=" * 40)
     
-    # Check if PyInstaller is available
-    try:
-        import PyInstaller
-        print(f"PyInstaller version: {PyInstaller.__version__}")
-    except ImportError:
-        print("PyInstaller not found. Installing...")
-        subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
+    # Check if the build backend is available
+    if args.backend == 'nuitka':
+        try:
+            from nuitka.Version import getNuitkaVersion
+            print(f"Nuitka version: {getNuitkaVersion()}")
+        except ImportError:
+            print("Nuitka not found. Installing...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', 'nuitka'], check=True)
+    else:
+        try:
+            import PyInstaller
+            print(f"PyInstaller version: {PyInstaller.__version__}")
+        except ImportError:
+            print("PyInstaller not found. Installing...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
     
     # Clean previous builds
     clean_build_dirs()
     
-    # Build executable
-    if not build_executable():
+    profiles = []
+    if args.gui:
+        profiles.append(False)
+    if args.cli:
+        profiles.append(True)
+    
+    # Build all requested profiles concurrently
+    processes = min(len(profiles), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes=processes) as pool:
+        results = pool.map(functools.partial(build_executable, backend=args.backend), profiles)
+    
+    if not all(results):
         print("Build failed!")
         sys.exit(1)
     
-    # Test executable
-    if not test_executable():
+    # Test executables while creating installer scripts; these steps are
+    # I/O bound and share no state, so they run in a thread pool
+    with ThreadPoolExecutor(max_workers=len(profiles) + 2) as executor:
+        test_futures = [executor.submit(test_executable, cli_only) for cli_only in profiles]
+        info_futures = [executor.submit(create_installer_script), executor.submit(create_package_info)]
+        for future in info_futures:
+            future.result()
+        test_results = [future.result() for future in test_futures]
+    
+    if not all(test_results):
         print("Warning: Executable test failed, but build completed")
     
-    # Create installer scripts
-    create_installer_script()
-    create_package_info()
+    archive_path = None
+    if not is_onefile_build():
+        # Name the archive after the only profile built, or the full build
+        archive_name = get_artifact_name(profiles[0]) if len(profiles) == 1 else get_artifact_name()
+        archive_path = package_release(profiles, Path('dist') / archive_name)
     
     print("\nBuild completed successfully!")
     print("\nFiles created:")
-    print(f"- dist/base-converter-{get_platform_info()[0]}-{get_platform_info()[1]}")
+    for cli_only in profiles:
+        print(f"- dist/{get_artifact_name(cli_only)}")
     print("- Installer script")
     print("- PACKAGE_INFO.txt")
-    
-    print("\nTo create a release package:")
-    print("1. Test the executable thoroughly")
-    print("2. Create a zip/tar.gz archive with the executable and installer")
-    print("3. Upload to GitHub Releases")
+    if archive_path:
+        print(f"- {archive_path}")
+        
+        print("\nTo publish the release package:")
+        print("1. Test the executable thoroughly")
+        print(f"2. Upload {archive_path.name} to GitHub Releases")
+    else:
+        print("\nTo create a release package:")
+        print("1. Test the executable thoroughly")
+        print("2. Create a zip/tar.gz archive with the executable and installer")
+        print("3. Upload to GitHub Releases")
 
 
 if __name__ == '__main__':
@@ -31,6 +31,7 @@ def parse_launcher_args(args: Optional[List[str]] = None) -> argparse.Namespace:
 
     # Parse known args to handle cases where CLI args are passed
     known_args, remaining = parser.parse_known_args(args)
+    known_args.gui_by_default = False
 
     # If no interface specified but there are remaining args or a number, use CLI
     if not known_args.gui and not known_args.cli:
@@ -46,6 +47,7 @@ def parse_launcher_args(args: Optional[List[str]] = None) -> argparse.Namespace:
             known_args.cli = True
         else:
             known_args.gui = True
+            known_args.gui_by_default = True
 
     known_args.remaining = remaining
     return known_args
@@ -96,6 +98,54 @@ Visit: https://github.com/6639835/base-converter
     print(help_text)
 
 
+def gui_available() -> bool:
+    """Check whether tkinter can be imported (it is absent from CLI-only builds)."""
+    try:
+        import tkinter  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def launch_gui() -> int:
+    """Launch the graphical interface.
+
+    The GUI module (and with it tkinter) is only imported here, so CLI
+    invocations never pay for loading Tk.
+    """
+    try:
+        from src import gui
+
+        gui_main = gui.main
+
+        gui_main()
+        return 0
+    except ImportError as e:
+        print(f"Error: Could not import GUI module: {e}")
+        print("GUI may not be available on this system.")
+        return 1
+    except Exception as e:
+        print(f"GUI Error: {e}")
+        return 1
+
+
+def launch_cli(remaining: List[str]) -> int:
+    """Launch the command-line interface with the remaining arguments."""
+    try:
+        from src import cli
+
+        cli_main = cli.main
+
+        sys.argv = ["base-converter"] + remaining
+        return cli_main()
+    except ImportError as e:
+        print(f"Error: Could not import CLI module: {e}")
+        return 1
+    except Exception as e:
+        print(f"CLI Error: {e}")
+        return 1
+
+
 def main(args: Optional[List[str]] = None):
     """Main entry point that launches the appropriate interface."""
     if args is None:
@@ -109,37 +159,13 @@ def main(args: Optional[List[str]] = None):
             return 0
 
         if launcher_args.gui:
-            # Launch GUI
-            try:
-                from src import gui
-
-                gui_main = gui.main
-
-                gui_main()
-                return 0
-            except ImportError as e:
-                print(f"Error: Could not import GUI module: {e}")
-                print("GUI may not be available on this system.")
-                return 1
-            except Exception as e:
-                print(f"GUI Error: {e}")
-                return 1
+            if launcher_args.gui_by_default and not gui_available():
+                # Without Tk, a bare invocation shows CLI help instead
+                return launch_cli(["--help"])
+            return launch_gui()
 
         elif launcher_args.cli:
-            # Launch CLI with remaining arguments
-            try:
-                from src import cli
-
-                cli_main = cli.main
-
-                sys.argv = ["base-converter"] + launcher_args.remaining
-                return cli_main()
-            except ImportError as e:
-                print(f"Error: Could not import CLI module: {e}")
-                return 1
-            except Exception as e:
-                print(f"CLI Error: {e}")
-                return 1
+            return launch_cli(launcher_args.remaining)
 
         else:
             # Default fallback
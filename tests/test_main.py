@@ -0,0 +1,54 @@
+"""
+Tests for the main launcher entry point.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add project root and src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from src.main import main, parse_launcher_args
+
+
+class TestLauncher:
+    """Test cases for interface selection in the launcher."""
+
+    def test_defaults_to_gui_without_arguments(self):
+        """Test that a bare launch selects the GUI by default."""
+        args = parse_launcher_args([])
+        assert args.gui == True
+        assert args.gui_by_default == True
+
+    def test_explicit_gui_is_not_default(self):
+        """Test that --gui is recorded as an explicit choice."""
+        args = parse_launcher_args(["--gui"])
+        assert args.gui == True
+        assert args.gui_by_default == False
+
+    def test_bare_launch_without_tkinter_shows_cli_help(self, capsys):
+        """Test that a bare launch falls back to CLI help when Tk is missing."""
+        with patch.dict(sys.modules, {"tkinter": None}):
+            with pytest.raises(SystemExit) as exc_info:
+                main([])
+
+        assert exc_info.value.code == 0
+        captured = capsys.readouterr()
+        assert "usage: base-converter" in captured.out
+        assert "Could not import GUI module" not in captured.out
+
+    def test_explicit_gui_without_tkinter_reports_error(self, capsys, monkeypatch):
+        """Test that --gui still reports a missing GUI instead of falling back."""
+        import src
+
+        monkeypatch.delattr(src, "gui", raising=False)
+        with patch.dict(sys.modules, {"tkinter": None, "src.gui": None}):
+            exit_code = main(["--gui"])
+
+        assert exit_code == 1
+        captured = capsys.readouterr()
+        assert "Could not import GUI module" in captured.out